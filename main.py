@@ -1,11 +1,17 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import orjson
 import time
 import os
 import random
-import string  # Keep for clean_name
-import math  # For batch calculation
+import re  # For clean_name
+import math
 import concurrent.futures
+from array import array
+import threading
+import sqlite3
 from urllib.parse import quote
 import logging  # Use standard logging
 import sys
@@ -21,15 +27,61 @@ except ImportError:
     # colorama is optional
     pass
 
-COLOR_RESET = "\033[0m"
-COLOR_DEBUG = "\033[0;33m"  # Yellow/Orange
-COLOR_INFO = "\033[0;32m"  # Green
-COLOR_WARNING = "\033[1;33m"  # Bright Yellow
-COLOR_ERROR = "\033[0;31m"  # Red
-COLOR_CRITICAL = "\033[1;31m"  # Bright Red
-COLOR_HANDLE = "\033[0;36m"  # Cyan
-COLOR_SEPARATOR = "\033[0;34m"  # Blue
-COLOR_RESPONSE = "\033[2;37m"  # Dim White/Grey
+try:
+    import numpy
+except ImportError:
+    # numpy is optional, only used to shuffle large name lists faster
+    numpy = None
+
+# Only emit ANSI codes when a terminal will render them; piped output and
+# log files get plain text.
+USE_COLOR = sys.stdout.isatty()
+
+
+def _C(code):
+    """Returns the ANSI color code, or an empty string when color is disabled."""
+    return code if USE_COLOR else ""
+
+
+COLOR_RESET = _C("\033[0m")
+COLOR_DEBUG = _C("\033[0;33m")  # Yellow/Orange
+COLOR_INFO = _C("\033[0;32m")  # Green
+COLOR_WARNING = _C("\033[1;33m")  # Bright Yellow
+COLOR_ERROR = _C("\033[0;31m")  # Red
+COLOR_CRITICAL = _C("\033[1;31m")  # Bright Red
+COLOR_HANDLE = _C("\033[0;36m")  # Cyan
+COLOR_SEPARATOR = _C("\033[0;34m")  # Blue
+COLOR_RESPONSE = _C("\033[2;37m")  # Dim White/Grey
+
+logger = logging.getLogger(__name__)
+
+
+def _h(value, color=COLOR_RESET):
+    """Renders a handle/ID in the handle color, then switches to `color` (the record's level color)."""
+    return f"{COLOR_HANDLE}{value}{color}"
+
+
+# --- Log Message Templates ---
+# Formatted lazily by logging; identifiers are passed through _h().
+# _h() builds its string eagerly, so DEBUG calls pass COLOR_HANDLE, the value
+# and the level color as separate arguments ("%s%s%s") instead.
+LOG_SEARCHING = "Searching profiles for term: '%s'"
+LOG_SEARCH_CACHED = "Using cached result for '%s': %d profile identifier(s) (%s)."
+LOG_SEARCH_FOUND = "Found %d profile identifier(s) (%s) for '%s'."
+LOG_SEARCH_NONE = "No profiles found in response for '%s'."
+LOG_FAIL_INVALID = "Failed to follow '%s': Invalid user identifier (API)."
+LOG_ALREADY_FOLLOWING = "Already following '%s'. Considered success."
+LOG_FAIL_RATE_LIMIT = "Rate limit hit trying to follow '%s'. Message: %s"
+LOG_FAIL_API_ERROR = "Failed to follow '%s': API Error - %s"
+LOG_OK = "Successfully followed '%s' (Status: %s, Type: %s)."
+LOG_FAIL_UNEXPECTED_STATUS = "Follow request for '%s' completed, but status/type unexpected (Status: %s, Type: %s)."
+LOG_FAIL_MALFORMED = "Follow request for '%s' completed, but 'follow' data missing or malformed in response."
+LOG_FAIL_NO_DATA = "Follow request for '%s' completed, but response lacks expected 'data' field and has no 'errors'."
+LOG_FAIL_DECODE = "Failed to decode JSON response for follow request '%s'."
+LOG_FAIL_PROCESSING = "Error processing follow response JSON for '%s': %s"
+LOG_FAIL_SUBMIT = "Follow request submission failed for '%s' (Network/HTTP issue)."
+LOG_SKIP_FOLLOWED = "Skipping %d already followed profile(s) for search term '%s'."
+LOG_FOLLOW_ATTEMPT = "--> Attempting follow for ID/Handle: '%s' (from search '%s')"
 
 
 # --- Custom Log Formatter ---
@@ -68,14 +120,216 @@ NAMES_FILE = "names.txt"  # File containing names, one per line
 SEARCH_API_URL_TEMPLATE = (
     "https://zora.co/api/trpc/mobile.profiles.searchProfile?input={encoded_input}"
 )
-FOLLOW_API_URL = "https://api.zora.co/universal/graphql"
-MAX_WORKERS = 1  # Adjust as needed for performance vs rate limiting
-SLEEP_DURATION_FOLLOW = 3  # Increased sleep between follows for the same search term
-SLEEP_DURATION_SEARCH_SUBMIT = (
-    0.1  # Sleep between submitting search tasks within a batch
+# Search URL split around the term, i.e. the percent-encoded {"json":{"text":"<term>"}}
+SEARCH_URL_PREFIX = SEARCH_API_URL_TEMPLATE.format(
+    encoded_input=quote('{"json":{"text":"', safe="")
 )
+SEARCH_URL_SUFFIX = quote('"}}', safe="")
+FOLLOW_API_URL = "https://api.zora.co/universal/graphql"
+MAX_WORKERS = int(
+    os.getenv("ZORA_MAX_WORKERS", "1")
+)  # Adjust as needed for performance vs rate limiting
 EXTRACT_PROFILE_ID_FIELD = True  # Set to True to use 'profileId', False for 'handle'
-BATCH_SIZE = 30  # Process in batches
+PROGRESS_REPORT_INTERVAL = 30  # Log a progress report every N completed searches
+MAX_REQUEST_ATTEMPTS = 6  # Total tries per request when rate limited (429) or on 5xx
+BACKOFF_BASE_DELAY = 0.5  # Seconds, doubled on each retry
+BACKOFF_MAX_DELAY = 60  # Upper bound for a single backoff delay (seconds)
+RETRY_AFTER_MAX_DELAY = 300  # Upper bound for a server-sent Retry-After (seconds)
+SEARCH_RATE_PER_SECOND = float(os.getenv("ZORA_SEARCH_RPS", "2"))  # Search requests/s
+SEARCH_RATE_BURST = int(os.getenv("ZORA_SEARCH_BURST", "5"))  # Max back-to-back searches
+FOLLOW_RATE_PER_SECOND = float(os.getenv("ZORA_FOLLOW_RPS", "2"))  # Follow requests/s
+FOLLOW_RATE_BURST = int(os.getenv("ZORA_FOLLOW_BURST", "5"))  # Max back-to-back follows
+RATE_INCREASE_AFTER = 20  # Consecutive successes before the refill rate is raised again
+CACHE_DIR = os.path.expanduser(
+    os.getenv("ZORA_CACHE_DIR", "~/.cache/zora_follow")
+)  # Search results and followed profiles persist here across runs
+SEARCH_CACHE_TTL = 24 * 60 * 60  # Seconds before a cached search result is refreshed
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+SEARCH_HEADERS = {"Accept": "application/json"}  # Per-call deltas on top of SESSION.headers
+FOLLOW_HEADERS = {"Content-Type": "application/json"}
+
+# --- Shared HTTP Session ---
+# One process-wide session so Keep-Alive reuses TCP/TLS connections across all
+# searches and follows. urllib3's pool is thread-safe, so workers share it.
+SESSION = requests.Session()
+SESSION.headers.update(
+    {
+        "Authorization": f"Bearer {AUTH_TOKEN}",
+        "User-Agent": USER_AGENT,
+    }
+)
+for _host_url in ("https://zora.co", "https://api.zora.co"):
+    SESSION.mount(
+        _host_url,
+        HTTPAdapter(
+            pool_connections=MAX_WORKERS * 2,
+            pool_maxsize=MAX_WORKERS * 4,
+            max_retries=Retry(total=0),
+        ),
+    )
+
+# --- Rate Limit Coordination ---
+# Set while requests may be sent. A 429 clears it until the backoff delay has
+# passed, so other workers wait instead of also hitting the limiter.
+RATE_LIMIT_LOCK = threading.Event()
+RATE_LIMIT_LOCK.set()
+_rate_limit_timer = None
+_rate_limit_deadline = 0.0  # time.monotonic() at which the current pause ends
+_rate_limit_timer_lock = threading.Lock()
+
+
+class TokenBucket:
+    """Client-side rate limiter shared by every worker sending to one host.
+
+    The refill rate follows additive-increase/multiplicative-decrease: it is
+    halved on each congestion event and raised by a tenth of the configured rate
+    after every RATE_INCREASE_AFTER consecutive successes, never exceeding the
+    configured rate.
+    """
+
+    def __init__(self, name, tokens_per_second, burst):
+        self.name = name
+        self.last_decrease = float("-inf")
+        self.max_rate = tokens_per_second
+        self.min_rate = tokens_per_second / 32
+        self.rate = tokens_per_second
+        self.burst = burst
+        self.tokens = float(burst)
+        self.last_refill = time.monotonic()
+        self.success_streak = 0
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        # Caller must hold self.lock
+        now = time.monotonic()
+        self.tokens = min(
+            self.burst, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    def acquire(self):
+        """Reserves the next send slot and sleeps until it arrives.
+
+        The token count may go negative: each caller takes a token under the lock
+        and then waits outside it for the debt to refill, so slots are handed out
+        in request order without polling.
+        """
+        with self.lock:
+            self._refill()
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def on_rate_limited(self):
+        """Multiplicative decrease after a 429, at most once per congestion event.
+
+        Requests already in flight when the limiter trips get 429s of their own;
+        those arrive while the shared pause is active or within one refill
+        interval of the last decrease, and are not counted again.
+        """
+        with self.lock:
+            self.success_streak = 0
+            now = time.monotonic()
+            if not RATE_LIMIT_LOCK.is_set() or now - self.last_decrease < 1 / self.rate:
+                return
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self.last_decrease = now
+        logger.debug("%s rate limited, refill rate now %.3f/s", self.name, self.rate)
+
+    def on_success(self):
+        """Additive increase once a stretch of requests has gone through."""
+        with self.lock:
+            self.success_streak += 1
+            if self.success_streak < RATE_INCREASE_AFTER or self.rate >= self.max_rate:
+                return
+            self._refill()
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 10)
+            self.success_streak = 0
+        logger.debug("%s refill rate raised to %.3f/s", self.name, self.rate)
+
+
+SEARCH_BUCKET = TokenBucket("Search", SEARCH_RATE_PER_SECOND, SEARCH_RATE_BURST)
+FOLLOW_BUCKET = TokenBucket("Follow", FOLLOW_RATE_PER_SECOND, FOLLOW_RATE_BURST)
+
+# --- Persistent Caches ---
+class SearchCache:
+    """Search results keyed by (cleaned name, extracted field), stored in SQLite.
+
+    Entries older than `ttl` seconds are ignored so stale profile sets get refreshed.
+    """
+
+    def __init__(self, path, ttl):
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS search_results ("
+                "term TEXT NOT NULL, field TEXT NOT NULL, identifiers TEXT NOT NULL, "
+                "fetched_at REAL NOT NULL, PRIMARY KEY (term, field))"
+            )
+
+    def get(self, term, field):
+        """Returns the cached tuple of identifiers, or None if missing or expired."""
+        key = (term, field)
+        with self.lock:
+            row = self.db.execute(
+                "SELECT identifiers, fetched_at FROM search_results WHERE term = ? AND field = ?",
+                key,
+            ).fetchone()
+            if row is None or time.time() - row[1] > self.ttl:
+                return None
+            return tuple(orjson.loads(row[0]))
+
+    def set(self, term, field, identifiers):
+        identifiers = tuple(identifiers)
+        with self.lock:
+            with self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO search_results VALUES (?, ?, ?, ?)",
+                    (term, field, orjson.dumps(identifiers).decode(), time.time()),
+                )
+
+
+class FollowedStore:
+    """Persistent set of profile identifiers followed (or already following) in any run."""
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS followed ("
+                "identifier TEXT PRIMARY KEY, followed_at REAL NOT NULL)"
+            )
+
+    def __contains__(self, identifier):
+        with self.lock:
+            return (
+                self.db.execute(
+                    "SELECT 1 FROM followed WHERE identifier = ?", (identifier,)
+                ).fetchone()
+                is not None
+            )
+
+    def add(self, identifier):
+        with self.lock, self.db:
+            self.db.execute(
+                "INSERT OR IGNORE INTO followed VALUES (?, ?)",
+                (identifier, time.time()),
+            )
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+
+# Opened in main unless --no-cache is given; None disables caching.
+SEARCH_CACHE = None
+FOLLOWED_PROFILES = None
 
 # --- GraphQL Follow Mutation ---
 FOLLOW_QUERY_STRING = """
@@ -94,179 +348,353 @@ fragment FollowButton_profile on IGraphQLProfile {
   vcFollowingStatus
 }
 """
+_thread_state = threading.local()  # Holds each worker's reusable follow payload
 
 # --- Helper Functions ---
 
 
+_CLEAN_RE = re.compile(r"[^A-Za-z]+")
+
+
 def clean_name(name):
-    """Removes non-ASCII alphabetic characters from a string."""
-    cleaned = "".join(c for c in name if c.isalpha() and c.isascii())
-    logging.debug(f"Cleaned '{name}' -> '{cleaned}'")
-    return cleaned
+    """Removes everything except ASCII letters from a string."""
+    return _CLEAN_RE.sub("", name)
 
 
-def make_request(method, url, headers, payload=None, description="request"):
-    """Makes an HTTP request, handles errors, returns response object or None."""
-    logging.debug(f"Making {method} {description} to {url}")
-    if payload:
-        logging.debug(
-            f"Payload keys: {list(payload.keys())}"
-            if isinstance(payload, dict)
-            else "Payload present"
-        )
+def retry_delay(response, attempt):
+    """Returns the jittered delay before retry `attempt`, honoring Retry-After when sent."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after:
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            seconds = None  # HTTP-date form, fall back to exponential backoff
+        # inf/nan would pause every worker forever or break time.sleep/Timer
+        if seconds is not None and math.isfinite(seconds):
+            seconds = max(0.0, min(seconds, RETRY_AFTER_MAX_DELAY))
+            return seconds + random.uniform(0, BACKOFF_BASE_DELAY)
+    return min(BACKOFF_MAX_DELAY, BACKOFF_BASE_DELAY * 2**attempt) * random.uniform(
+        0.5, 1.5
+    )
+
+
+def pause_requests(delay):
+    """Blocks all workers in make_request for `delay` seconds. A longer pause already running is kept."""
+    global _rate_limit_timer, _rate_limit_deadline
+    with _rate_limit_timer_lock:
+        deadline = time.monotonic() + delay
+        if deadline <= _rate_limit_deadline:
+            return
+        _rate_limit_deadline = deadline
+        if _rate_limit_timer is not None:
+            _rate_limit_timer.cancel()
+        RATE_LIMIT_LOCK.clear()
+        _rate_limit_timer = threading.Timer(delay, RATE_LIMIT_LOCK.set)
+        _rate_limit_timer.daemon = True
+        _rate_limit_timer.start()
+
+
+def index_names(path):
+    """Scans the names file once and returns the byte offsets of the lines to process.
+
+    Only the first line for each distinct cleaned name is kept, and lines that
+    clean to nothing are dropped, so the main loop never revisits them. Returns
+    (offsets, names_read_count, skipped_duplicates, skipped_invalid).
+    """
+    offsets = array("q")
+    seen_cleaned_names = set()
+    names_read_count = skipped_duplicates = skipped_invalid = 0
+    offset = 0
+    with open(path, "rb") as f:
+        for line in f:
+            line_offset = offset
+            offset += len(line)
+            raw_name = line.decode("utf-8").strip()
+            if not raw_name:
+                continue
+            names_read_count += 1
+            cleaned_name = clean_name(raw_name)
+            if not cleaned_name:
+                logger.debug("Skipping empty name after cleaning original '%s'.", raw_name)
+                skipped_invalid += 1
+            elif cleaned_name in seen_cleaned_names:
+                logger.debug(
+                    "Skipping duplicate cleaned name: '%s%s%s' (Original: '%s')",
+                    COLOR_HANDLE,
+                    cleaned_name,
+                    COLOR_DEBUG,
+                    raw_name,
+                )
+                skipped_duplicates += 1
+            else:
+                seen_cleaned_names.add(cleaned_name)
+                offsets.append(line_offset)
+    return offsets, names_read_count, skipped_duplicates, skipped_invalid
+
+
+def shuffle_offsets(offsets):
+    """Returns the offsets array in random order, shuffled in C by numpy when available."""
+    if numpy is None:
+        random.shuffle(offsets)
+        return offsets
+    shuffled = numpy.random.default_rng().permutation(
+        numpy.frombuffer(offsets, dtype=numpy.int64)
+    )
+    return array("q", shuffled.tobytes())
+
+
+def read_name_at(f, offset):
+    """Reads the stripped name on the line starting at `offset` of a binary file."""
+    f.seek(offset)
+    return f.readline().decode("utf-8").strip()
+
+
+def parse_json(response):
+    """Parses a JSON response body straight from its bytes.
+
+    The API always answers in UTF-8, so this skips requests' charset detection
+    (response.json() and response.text go through it) and never touches .text.
+    """
+    return orjson.loads(response.content)
+
+
+def response_body_text(response):
+    """Decodes a response body as UTF-8 for logging, without charset detection."""
+    return response.content.decode("utf-8", errors="replace")
+
+
+def warm_up_connection(url):
+    """Opens a pooled keep-alive connection to `url`'s host; failures are ignored."""
     try:
-        if method.upper() == "POST":
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
-        else:  # Default to GET
-            response = requests.get(url, headers=headers, timeout=30)
+        SESSION.head(url, timeout=10)
+        logger.debug("Warmed up connection to %s", url)
+    except requests.exceptions.RequestException as e:
+        logger.debug("Connection warm-up to %s failed: %s", url, e)
 
-        logging.debug(
-            f"{description.capitalize()} response status: {response.status_code}"
-        )
 
-        # Log full body only at DEBUG level AND if it's NOT a search request
-        if logging.getLogger().isEnabledFor(logging.DEBUG):
-            is_search_request = description.startswith("search for")
-            if not is_search_request:  # <-- Only log body if not a search request
-                response_body_text = response.text
-                logging.debug(f"{description.capitalize()} Response Body:")
-                try:
-                    parsed_json = response.json()
-                    logging.debug(
-                        f"\n{COLOR_RESPONSE}{json.dumps(parsed_json, indent=2)}{COLOR_RESET}"
-                    )
-                except json.JSONDecodeError:
-                    logging.debug(
-                        f"\n{COLOR_RESPONSE}{response_body_text}{COLOR_RESET}"
+def make_request(
+    method, url, headers, payload=None, description="request", bucket=None
+):
+    """Makes an HTTP request on the shared session, handles errors, returns response object or None.
+
+    `headers` only needs the per-call deltas; Authorization and User-Agent come from SESSION.
+    Rate limits (429) and server errors (5xx) are retried with exponential backoff and jitter.
+    If a TokenBucket is given, a token is taken from it before every attempt.
+    """
+    logger.debug("Making %s %s to %s", method, description, url)
+    if payload:
+        if isinstance(payload, dict):
+            logger.debug("Payload keys: %s", list(payload))
+        else:
+            logger.debug("Payload present")
+    for attempt in range(MAX_REQUEST_ATTEMPTS):
+        if bucket is not None:
+            bucket.acquire()
+        # Wait out any rate limit pause triggered by another worker
+        RATE_LIMIT_LOCK.wait()
+        try:
+            if method.upper() == "POST":
+                response = SESSION.post(url, headers=headers, json=payload, timeout=30)
+            else:  # Default to GET
+                response = SESSION.get(url, headers=headers, timeout=30)
+
+            logger.debug(
+                "%s response status: %s", description.capitalize(), response.status_code
+            )
+
+            # Log full body only at DEBUG level AND if it's NOT a search request
+            if logger.isEnabledFor(logging.DEBUG):
+                is_search_request = description.startswith("search for")
+                if not is_search_request:  # <-- Only log body if not a search request
+                    logger.debug("%s Response Body:", description.capitalize())
+                    try:
+                        parsed_json = parse_json(response)
+                        logger.debug(
+                            "\n%s%s%s",
+                            COLOR_RESPONSE,
+                            orjson.dumps(parsed_json, option=orjson.OPT_INDENT_2).decode(),
+                            COLOR_RESET,
+                        )
+                    except json.JSONDecodeError:
+                        logger.debug(
+                            "\n%s%s%s",
+                            COLOR_RESPONSE,
+                            response_body_text(response),
+                            COLOR_RESET,
+                        )
+                    logger.debug(
+                        "%s----------------------------------------%s",
+                        COLOR_SEPARATOR,
+                        COLOR_RESET,
                     )
-                logging.debug(
-                    f"{COLOR_SEPARATOR}----------------------------------------{COLOR_RESET}"
+                # else: # Optional: Log that body logging was skipped for search
+                #     logger.debug(f"Skipping response body logging for {description}.")
+
+            response.raise_for_status()
+            if bucket is not None:
+                bucket.on_success()
+            return response
+
+        except requests.exceptions.Timeout:
+            logger.error("%s request timed out to %s", description.capitalize(), url)
+        except requests.exceptions.ConnectionError:
+            logger.error("Connection error during %s to %s", description, url)
+        except requests.exceptions.HTTPError as e:
+            # Log specific HTTP errors, especially rate limits if possible
+            status_code = e.response.status_code
+            reason = e.response.reason
+            log_level = logging.ERROR
+            # Treat 429 Rate Limit as a warning and back off before retrying
+            if status_code == 429:
+                log_level = logging.WARNING
+                reason += " (Rate Limit)"
+                if bucket is not None:
+                    bucket.on_rate_limited()
+
+            if (status_code == 429 or status_code >= 500) and (
+                attempt < MAX_REQUEST_ATTEMPTS - 1
+            ):
+                delay = retry_delay(e.response, attempt)
+                logger.warning(
+                    "HTTP error during %s: %s %s. Retrying in %.1fs (attempt %d/%d).",
+                    description,
+                    status_code,
+                    reason,
+                    delay,
+                    attempt + 1,
+                    MAX_REQUEST_ATTEMPTS,
                 )
-            # else: # Optional: Log that body logging was skipped for search
-            #     logging.debug(f"Skipping response body logging for {description}.")
-
-        response.raise_for_status()
-        return response
-
-    except requests.exceptions.Timeout:
-        logging.error(f"{description.capitalize()} request timed out to {url}")
-    except requests.exceptions.ConnectionError:
-        logging.error(f"Connection error during {description} to {url}")
-    except requests.exceptions.HTTPError as e:
-        # Log specific HTTP errors, especially rate limits if possible
-        status_code = e.response.status_code
-        reason = e.response.reason
-        log_level = logging.ERROR
-        # Treat 429 Rate Limit as a warning, maybe implement backoff later
-        if status_code == 429:
-            log_level = logging.WARNING
-            reason += " (Rate Limit)"
-
-        logging.log(
-            log_level, f"HTTP error during {description}: {status_code} {reason}"
-        )
-        # Log error response body at WARNING or ERROR level for better diagnosis
-        try:
-            error_body = e.response.text
-            logging.log(
-                log_level, f"Error Response Body: {error_body[:500]}..."
-            )  # Log truncated body
-        except Exception:
-            pass
+                if status_code == 429:
+                    pause_requests(delay)  # Picked up by RATE_LIMIT_LOCK.wait()
+                else:
+                    time.sleep(delay)
+                continue
 
-    except requests.exceptions.RequestException as e:
-        logging.error(f"Error during {description} request: {e}")
-    except Exception as e:
-        logging.error(f"An unexpected error occurred during {description}: {e}")
+            logger.log(
+                log_level, "HTTP error during %s: %s %s", description, status_code, reason
+            )
+            # Log error response body at WARNING or ERROR level for better diagnosis
+            try:
+                error_body = response_body_text(e.response)
+                logger.log(
+                    log_level, "Error Response Body: %s...", error_body[:500]
+                )  # Log truncated body
+            except Exception:
+                pass
+
+        except requests.exceptions.RequestException as e:
+            logger.error("Error during %s request: %s", description, e)
+        except Exception as e:
+            logger.error("An unexpected error occurred during %s: %s", description, e)
+
+        return None
 
     return None
 
 
-def search_profiles(search_term, auth_token):
+def search_profiles(search_term):
     """Searches for profiles based on the search term, returns list of identifiers or empty list."""
-    logging.info(
-        f"Searching profiles for term: '{COLOR_HANDLE}{search_term}{COLOR_RESET}'"
-    )
+    logger.info(LOG_SEARCHING, _h(search_term))
     search_field = "profileId" if EXTRACT_PROFILE_ID_FIELD else "handle"
     profile_identifiers = []
 
+    if SEARCH_CACHE is not None:
+        cached = SEARCH_CACHE.get(search_term, search_field)
+        if cached is not None:
+            logger.info(
+                LOG_SEARCH_CACHED,
+                _h(search_term),
+                len(cached),
+                search_field,
+            )
+            return list(cached)
+
     try:
-        input_json_obj = {"json": {"text": search_term}}
-        input_json_str = json.dumps(input_json_obj, separators=(",", ":"))
-        encoded_input = quote(input_json_str)
-
-        url = SEARCH_API_URL_TEMPLATE.format(encoded_input=encoded_input)
-        headers = {
-            "Authorization": f"Bearer {auth_token}",
-            "Accept": "application/json",
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-        }
+        if search_term.isascii() and search_term.isalpha():
+            # Always true after clean_name: nothing to escape or percent-encode
+            url = SEARCH_URL_PREFIX + search_term + SEARCH_URL_SUFFIX
+        else:
+            input_json = json.dumps(
+                {"json": {"text": search_term}}, separators=(",", ":")
+            )
+            encoded_input = quote(input_json, safe="")
+            url = SEARCH_API_URL_TEMPLATE.format(encoded_input=encoded_input)
 
         # Note: Response body logging for search is suppressed in make_request at DEBUG level
         response = make_request(
-            "GET", url, headers, description=f"search for '{search_term}'"
+            "GET",
+            url,
+            SEARCH_HEADERS,
+            description=f"search for '{search_term}'",
+            bucket=SEARCH_BUCKET,
         )
 
         if response:
-            data = response.json()
-            profiles = (
-                data.get("result", {})
-                .get("data", {})
-                .get("json", {})
-                .get("profiles", [])
-            )
+            data = parse_json(response)
+            try:
+                profiles = data["result"]["data"]["json"]["profiles"]
+            except (KeyError, TypeError):
+                profiles = []
             if profiles:
                 profile_identifiers = [
                     p.get(search_field) for p in profiles if p.get(search_field)
                 ]
-                logging.info(
-                    f"Found {len(profile_identifiers)} profile identifier(s) ({search_field}) for '{COLOR_HANDLE}{search_term}{COLOR_RESET}'."
+                logger.info(
+                    LOG_SEARCH_FOUND,
+                    len(profile_identifiers),
+                    search_field,
+                    _h(search_term),
                 )
-                logging.debug(f"Identifiers found: {profile_identifiers}")
+                logger.debug("Identifiers found: %s", profile_identifiers)
             else:
-                logging.info(
-                    f"No profiles found in response for '{COLOR_HANDLE}{search_term}{COLOR_RESET}'."
+                logger.info(
+                    LOG_SEARCH_NONE,
+                    _h(search_term),
                 )
+            # Only successful responses are cached, so failed searches get retried next run
+            if SEARCH_CACHE is not None:
+                SEARCH_CACHE.set(search_term, search_field, profile_identifiers)
 
     except json.JSONDecodeError:
-        logging.error(
-            f"Failed to decode JSON response for search term '{search_term}'. Request might have failed or returned non-JSON."
+        logger.error(
+            "Failed to decode JSON response for search term '%s'. Request might have failed or returned non-JSON.",
+            search_term,
         )
     except Exception as e:
-        logging.error(
-            f"An unexpected error occurred during search processing for '{search_term}': {e}"
+        logger.error(
+            "An unexpected error occurred during search processing for '%s': %s",
+            search_term,
+            e,
         )
 
     return profile_identifiers
 
 
-def follow_profile(profile_identifier, auth_token):
+def follow_profile(profile_identifier):
     """Follows a profile and logs a concise status. Returns True on API success/already following, False otherwise."""
-    follow_id_to_use = (
-        profile_identifier  # API expects profileId or handle here based on its logic
-    )
-
-    headers = {
-        "Authorization": f"Bearer {auth_token}",
-        "Content-Type": "application/json",
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-    }
-    payload = {
-        "query": FOLLOW_QUERY_STRING,
-        "variables": {"profileId": follow_id_to_use},
-    }
+    # Reuse this thread's payload; requests serializes it before we return,
+    # so only the profileId needs replacing on the next call.
+    payload = getattr(_thread_state, "follow_payload", None)
+    if payload is None:
+        payload = _thread_state.follow_payload = {
+            "query": FOLLOW_QUERY_STRING,
+            "variables": {"profileId": None},
+        }
+    # API expects profileId or handle here based on its logic
+    payload["variables"]["profileId"] = profile_identifier
 
     response = make_request(
         "POST",
         FOLLOW_API_URL,
-        headers,
+        FOLLOW_HEADERS,
         payload=payload,
         description=f"follow '{profile_identifier}'",
+        bucket=FOLLOW_BUCKET,
     )
 
     if response:
         try:
-            data = response.json()
+            data = parse_json(response)
             errors = data.get("errors")
             api_data_field = data.get("data")  # Get the top-level 'data' field safely
 
@@ -278,26 +706,32 @@ def follow_profile(profile_identifier, auth_token):
 
                 # Specific error handling
                 if "Invalid user identifier" in error_message:
-                    logging.warning(
-                        f"Failed to follow '{COLOR_HANDLE}{profile_identifier}{COLOR_WARNING}': Invalid user identifier (API)."
+                    logger.warning(
+                        LOG_FAIL_INVALID,
+                        _h(profile_identifier, COLOR_WARNING),
                     )
                 elif "already following" in error_message.lower():
                     # This isn't really an error for our script's goal
-                    logging.info(
-                        f"Already following '{COLOR_HANDLE}{profile_identifier}{COLOR_INFO}'. Considered success."
+                    logger.info(
+                        LOG_ALREADY_FOLLOWING,
+                        _h(profile_identifier, COLOR_INFO),
                     )
                     return True  # Treat 'already following' as success
                 elif "Rate limit exceeded" in error_message:
                     # Log as warning, could implement backoff/retry later
-                    logging.warning(
-                        f"Rate limit hit trying to follow '{COLOR_HANDLE}{profile_identifier}{COLOR_WARNING}'. Message: {error_message}"
+                    logger.warning(
+                        LOG_FAIL_RATE_LIMIT,
+                        _h(profile_identifier, COLOR_WARNING),
+                        error_message,
                     )
                     # Consider a short sleep here if rate limits are frequent
                     # time.sleep(1)
                 else:
                     # Log other API errors
-                    logging.error(
-                        f"Failed to follow '{COLOR_HANDLE}{profile_identifier}{COLOR_ERROR}': API Error - {error_message}"
+                    logger.error(
+                        LOG_FAIL_API_ERROR,
+                        _h(profile_identifier, COLOR_ERROR),
+                        error_message,
                     )
                 return False  # API reported an error (excluding 'already following')
 
@@ -314,100 +748,123 @@ def follow_profile(profile_identifier, auth_token):
                         "GraphQLAccountProfile",
                         "IGraphQLFollowResult",
                     ]:
-                        logging.info(
-                            f"Successfully followed '{COLOR_HANDLE}{profile_identifier}{COLOR_INFO}' (Status: {status}, Type: {typename})."
+                        logger.info(
+                            LOG_OK,
+                            _h(profile_identifier, COLOR_INFO),
+                            status,
+                            typename,
                         )
                         return True
                     else:
                         # Data structure seems okay, but status/type unexpected
-                        logging.warning(
-                            f"Follow request for '{COLOR_HANDLE}{profile_identifier}{COLOR_WARNING}' completed, but status/type unexpected (Status: {status}, Type: {typename})."
-                        )
-                        logging.debug(
-                            f"Unexpected follow response details: {json.dumps(follow_result, indent=2)}"
+                        logger.warning(
+                            LOG_FAIL_UNEXPECTED_STATUS,
+                            _h(profile_identifier, COLOR_WARNING),
+                            status,
+                            typename,
                         )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Unexpected follow response details: %s",
+                                orjson.dumps(
+                                    follow_result, option=orjson.OPT_INDENT_2
+                                ).decode(),
+                            )
                         return False  # Treat as failure for consistency
                 else:
                     # 'data' field existed, but no 'follow' key or it wasn't a dict
-                    logging.warning(
-                        f"Follow request for '{COLOR_HANDLE}{profile_identifier}{COLOR_WARNING}' completed, but 'follow' data missing or malformed in response."
+                    logger.warning(
+                        LOG_FAIL_MALFORMED,
+                        _h(profile_identifier, COLOR_WARNING),
                     )
-                    logging.debug(
-                        f"Malformed follow response data field: {api_data_field}"
+                    logger.debug(
+                        "Malformed follow response data field: %s", api_data_field
                     )
                     return False  # Treat as failure
             else:
                 # No 'errors' and no 'data' field or 'data' is null/not a dict
-                logging.error(
-                    f"Follow request for '{COLOR_HANDLE}{profile_identifier}{COLOR_ERROR}' completed, but response lacks expected 'data' field and has no 'errors'."
-                )
-                logging.debug(
-                    f"Unexpected response structure: {json.dumps(data, indent=2)}"
+                logger.error(
+                    LOG_FAIL_NO_DATA,
+                    _h(profile_identifier, COLOR_ERROR),
                 )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Unexpected response structure: %s",
+                        orjson.dumps(data, option=orjson.OPT_INDENT_2).decode(),
+                    )
                 return False  # Treat as failure
 
         except json.JSONDecodeError:
-            logging.error(
-                f"Failed to decode JSON response for follow request '{COLOR_HANDLE}{profile_identifier}{COLOR_ERROR}'."
+            logger.error(
+                LOG_FAIL_DECODE,
+                _h(profile_identifier, COLOR_ERROR),
             )
             return False
         except Exception as e:
             # Catch unexpected errors during the processing of the JSON response
             # This should prevent the 'NoneType' error if data structure is unexpected after error checks
-            logging.error(
-                f"Error processing follow response JSON for '{COLOR_HANDLE}{profile_identifier}{COLOR_ERROR}': {e}",
-                exc_info=logging.getLogger().isEnabledFor(logging.DEBUG),
+            logger.error(
+                LOG_FAIL_PROCESSING,
+                _h(profile_identifier, COLOR_ERROR),
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )  # Show traceback if verbose
             return False
     else:
         # make_request already logged the HTTP/connection error
-        logging.error(
-            f"Follow request submission failed for '{COLOR_HANDLE}{profile_identifier}{COLOR_ERROR}' (Network/HTTP issue)."
+        logger.error(
+            LOG_FAIL_SUBMIT,
+            _h(profile_identifier, COLOR_ERROR),
         )
         return False  # Request itself failed
 
 
-def process_search_term(search_term, auth_token, sleep_follow):
-    """Worker function: searches for a term and follows results."""
-    profile_identifiers = search_profiles(search_term, auth_token)
-    followed_success_count = 0
-    attempted_count = len(profile_identifiers)
+def process_search_term(search_term):
+    """Search worker: returns (search_term, identifiers still to follow, already-followed identifiers).
 
-    if profile_identifiers:
-        logging.info(
-            f"Starting follow process for {attempted_count} profile(s) found for search term '{COLOR_HANDLE}{search_term}{COLOR_RESET}'."
-        )
-        for i, identifier in enumerate(profile_identifiers):
-            # Add a small delay *before* attempting follow, especially if rate limits occur
-            # time.sleep(0.5) # Optional small delay before each follow attempt
+    Duplicates across searches are resolved by the main thread, which sees every
+    result in completion order; the worker only splits off stored follows.
+    """
+    profile_identifiers = search_profiles(search_term)
+    already_followed = []
 
-            logging.info(
-                f"--> Attempting follow {i+1}/{attempted_count} for ID/Handle: '{COLOR_HANDLE}{identifier}{COLOR_INFO}' (from search '{search_term}')"
+    if FOLLOWED_PROFILES is not None:
+        # Known-followed profiles count as success without a follow request
+        to_follow = []
+        for p in profile_identifiers:
+            if p in FOLLOWED_PROFILES:
+                already_followed.append(p)
+            else:
+                to_follow.append(p)
+        profile_identifiers = to_follow
+        if already_followed:
+            logger.info(
+                LOG_SKIP_FOLLOWED,
+                len(already_followed),
+                _h(search_term),
             )
-            if follow_profile(identifier, auth_token):
-                followed_success_count += 1
-            # else: # Optional: Add extra sleep if a follow attempt failed (e.g., rate limited)
-            #     logging.warning(f"Follow failed for {identifier}, adding extra sleep...")
-            #     time.sleep(sleep_follow * 2) # Double sleep after failure
-
-            # Sleep between follow attempts for the *same* search term results
-            if i < attempted_count - 1 and sleep_follow > 0:
-                logging.debug(f"Sleeping for {sleep_follow}s before next follow...")
-                time.sleep(sleep_follow)
-
-        logging.info(
-            f"Finished following for search term '{COLOR_HANDLE}{search_term}{COLOR_RESET}'. Success/Already Following: {followed_success_count}/{attempted_count}."
-        )
-    else:
-        pass  # No action needed if no profiles found
 
-    return search_term, followed_success_count, attempted_count
+    return search_term, profile_identifiers, already_followed
+
+
+def process_follow(identifier, search_term):
+    """Follow worker: follows one profile and records it. Pacing comes from FOLLOW_BUCKET."""
+    logger.info(
+        LOG_FOLLOW_ATTEMPT,
+        _h(identifier, COLOR_INFO),
+        search_term,
+    )
+    if follow_profile(identifier):
+        if FOLLOWED_PROFILES is not None:
+            FOLLOWED_PROFILES.add(identifier)
+        return True
+    return False
 
 
 # --- Main Execution ---
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
-        description="Zora Profile Follower Script using names list and batches"
+        description="Zora Profile Follower Script using names list"
     )
     parser.add_argument(
         "-v",
@@ -415,6 +872,11 @@ if __name__ == "__main__":
         action="store_true",
         help="Enable verbose (DEBUG) logging output.",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Do not read or write the search result and followed profile caches.",
+    )
     args = parser.parse_args()
 
     # Configure Logging
@@ -427,169 +889,234 @@ if __name__ == "__main__":
     # Setup new handler
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setLevel(log_level)
-    formatter = ColoredFormatter(ColoredFormatter.LOG_FORMAT)
+    if USE_COLOR:
+        formatter = ColoredFormatter(ColoredFormatter.LOG_FORMAT)
+    else:
+        formatter = logging.Formatter(ColoredFormatter.LOG_FORMAT)
     stream_handler.setFormatter(formatter)
     root_logger.addHandler(stream_handler)
 
     # --- Start Script ---
     print(f"{COLOR_SEPARATOR}========================================{COLOR_RESET}")
-    logging.info("Starting Zora Profile Follower Script (from names list, batched)")
+    logger.info("Starting Zora Profile Follower Script (from names list, streamed)")
     print(f"{COLOR_SEPARATOR}========================================{COLOR_RESET}")
 
     if (
         not AUTH_TOKEN or AUTH_TOKEN == "YOUR_FRESH_BEARER_TOKEN_HERE"
     ):  # Check placeholder too
-        logging.critical("Authentication token is missing or is the placeholder.")
-        logging.critical(
+        logger.critical("Authentication token is missing or is the placeholder.")
+        logger.critical(
             f"Please set the ZORA_AUTH_TOKEN environment variable or replace the placeholder in the script."
         )
         sys.exit(1)
     else:
-        logging.info(f"Authentication token loaded (starts with: {AUTH_TOKEN[:8]}...).")
-
-    logging.info(f"Log Level set to: {'DEBUG' if args.verbose else 'INFO'}")
-    logging.info(f"Reading names from: {NAMES_FILE}")
-    logging.info(f"Using up to {MAX_WORKERS} parallel workers.")
-    logging.info(f"Processing in batches of size: {BATCH_SIZE}")
-    logging.info(
-        f"Follow sleep duration between profiles (same search): {SLEEP_DURATION_FOLLOW}s"
-    )
-    logging.info(
-        f"Search task submission sleep (within batch): {SLEEP_DURATION_SEARCH_SUBMIT}s"
+        logger.info(f"Authentication token loaded (starts with: {AUTH_TOKEN[:8]}...).")
+
+    if not (SEARCH_RATE_PER_SECOND > 0 and FOLLOW_RATE_PER_SECOND > 0):
+        logger.critical(
+            "ZORA_SEARCH_RPS and ZORA_FOLLOW_RPS must be greater than 0 "
+            f"(got {SEARCH_RATE_PER_SECOND} and {FOLLOW_RATE_PER_SECOND})."
+        )
+        sys.exit(1)
+
+    logger.info(f"Log Level set to: {'DEBUG' if args.verbose else 'INFO'}")
+    logger.info(f"Reading names from: {NAMES_FILE}")
+    logger.info(f"Using up to {MAX_WORKERS} parallel workers.")
+    logger.info(f"Reporting progress every {PROGRESS_REPORT_INTERVAL} searches")
+    logger.info(
+        f"Rate limits: {SEARCH_RATE_PER_SECOND}/s searches (burst {SEARCH_RATE_BURST}), {FOLLOW_RATE_PER_SECOND}/s follows (burst {FOLLOW_RATE_BURST})"
     )
-    logging.info(
+    logger.info(
         f"Extracting field from search: {'profileId' if EXTRACT_PROFILE_ID_FIELD else 'handle'}"
     )
+    if args.no_cache:
+        logger.info("Caching disabled (--no-cache).")
+    else:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        SEARCH_CACHE = SearchCache(
+            os.path.join(CACHE_DIR, "search_cache.sqlite"), SEARCH_CACHE_TTL
+        )
+        FOLLOWED_PROFILES = FollowedStore(
+            os.path.join(CACHE_DIR, "followed_ids.sqlite")
+        )
+        logger.info(
+            f"Using cache directory: {CACHE_DIR} (search results expire after {SEARCH_CACHE_TTL}s)"
+        )
 
-    processed_cleaned_names = set()
+    queued_identifiers = set()  # Profiles already queued or credited this run
     total_tasks_submitted = 0
     total_profiles_found = 0
     total_successful_follows = 0
     skipped_duplicates = 0
+    skipped_duplicate_profiles = 0
     skipped_invalid = 0
     names_read_count = 0
 
     try:
-        with open(NAMES_FILE, "r", encoding="utf-8") as f:
-            raw_names = [line.strip() for line in f if line.strip()]
-        names_read_count = len(raw_names)
-        logging.info(
-            f"Read {names_read_count} names from '{NAMES_FILE}'. Shuffling order for processing..."
+        # Keep only line offsets in memory and read each name on demand
+        name_offsets, names_read_count, skipped_duplicates, skipped_invalid = (
+            index_names(NAMES_FILE)
         )
-        random.shuffle(raw_names)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-            num_batches = math.ceil(names_read_count / BATCH_SIZE)
-            logging.info(
-                f"Processing {names_read_count} names in {num_batches} batches of up to {BATCH_SIZE}."
+        unique_names_count = len(name_offsets)
+        logger.info(
+            f"Read {names_read_count} names from '{NAMES_FILE}' ({unique_names_count} unique after cleaning). Shuffling order for processing..."
+        )
+        name_offsets = shuffle_offsets(name_offsets)
+
+        # Stream names through the search pool, keeping at most MAX_IN_FLIGHT
+        # searches and follows pending. Each completed search immediately feeds
+        # its new identifiers to the follow pool, paced by FOLLOW_BUCKET, so one
+        # slow search never holds up the rest.
+        max_in_flight = MAX_WORKERS * 2
+        pending_searches = set()
+        pending_follows = set()
+        searches_completed = 0
+        follows_completed = 0
+        next_progress_report = PROGRESS_REPORT_INTERVAL
+        name_offsets_iter = iter(name_offsets)
+        names_exhausted = False
+        with open(
+            NAMES_FILE, "rb"
+        ) as names_file, concurrent.futures.ThreadPoolExecutor(
+            max_workers=MAX_WORKERS
+        ) as search_executor, concurrent.futures.ThreadPoolExecutor(
+            max_workers=MAX_WORKERS
+        ) as follow_executor:
+            logger.info(
+                f"Processing {unique_names_count} names with up to {max_in_flight} searches and follows in flight."
             )
-
-            for batch_num in range(num_batches):
-                start_index = batch_num * BATCH_SIZE
-                end_index = min((batch_num + 1) * BATCH_SIZE, names_read_count)
-                current_batch_names = raw_names[start_index:end_index]
-                batch_futures = []
-
-                logging.info(
-                    f"{COLOR_SEPARATOR}--- Starting Batch {batch_num + 1}/{num_batches} ({len(current_batch_names)} names) ---{COLOR_RESET}"
-                )
-
-                tasks_in_batch = 0
-                for raw_name in current_batch_names:
+            # Open the follow connection while the first searches are running
+            threading.Thread(
+                target=warm_up_connection, args=(FOLLOW_API_URL,), daemon=True
+            ).start()
+
+            while True:
+                # Top up the search pipeline while there is room in both queues
+                while (
+                    not names_exhausted
+                    and len(pending_searches) < max_in_flight
+                    and len(pending_follows) < max_in_flight
+                ):
+                    offset = next(name_offsets_iter, None)
+                    if offset is None:
+                        names_exhausted = True
+                        break
+                    raw_name = read_name_at(names_file, offset)
                     cleaned_name = clean_name(raw_name)
+                    if args.verbose:
+                        logger.debug("Cleaned '%s' -> '%s'", raw_name, cleaned_name)
 
-                    if not cleaned_name:
-                        logging.debug(
-                            f"Skipping empty name after cleaning original '{raw_name}' in batch {batch_num + 1}."
-                        )
-                        skipped_invalid += 1
-                        continue
-
-                    if cleaned_name not in processed_cleaned_names:
-                        processed_cleaned_names.add(cleaned_name)
-                        logging.info(
-                            f"Submitting task for cleaned name: '{COLOR_HANDLE}{cleaned_name}{COLOR_INFO}' (Original: '{raw_name}') [Batch {batch_num + 1}]"
-                        )
-                        future = executor.submit(
-                            process_search_term,
-                            cleaned_name,
-                            AUTH_TOKEN,
-                            SLEEP_DURATION_FOLLOW,
-                        )
-                        batch_futures.append(future)
-                        total_tasks_submitted += 1
-                        tasks_in_batch += 1
-                        if SLEEP_DURATION_SEARCH_SUBMIT > 0:
-                            time.sleep(SLEEP_DURATION_SEARCH_SUBMIT)
-                    else:
-                        logging.info(
-                            f"Skipping duplicate cleaned name: '{COLOR_HANDLE}{cleaned_name}{COLOR_INFO}' (Original: '{raw_name}') [Batch {batch_num + 1}]"
-                        )
-                        skipped_duplicates += 1
-
-                if not batch_futures:
-                    logging.warning(
-                        f"No valid, unique tasks submitted for Batch {batch_num + 1}. Skipping wait."
+                    logger.info(
+                        "Submitting task for cleaned name: '%s' (Original: '%s')",
+                        _h(cleaned_name, COLOR_INFO),
+                        raw_name,
+                    )
+                    pending_searches.add(
+                        search_executor.submit(process_search_term, cleaned_name)
                     )
-                    continue
+                    total_tasks_submitted += 1
 
-                logging.info(
-                    f"Submitted {tasks_in_batch} tasks for Batch {batch_num + 1}. Waiting for completion..."
-                )
+                if not pending_searches and not pending_follows:
+                    break
 
-                completed_in_batch = 0
-                for future in concurrent.futures.as_completed(batch_futures):
-                    completed_in_batch += 1
-                    try:
-                        term, followed_count, found_count = future.result()
-                        total_successful_follows += followed_count
-                        total_profiles_found += found_count
-                        logging.debug(
-                            f"[Batch {batch_num+1}] Task for '{term}' completed. Success: {followed_count}, Found: {found_count}"
-                        )
-                    except Exception as exc:
-                        # Log exceptions raised by the worker function itself
-                        logging.error(
-                            f"[Batch {batch_num+1}] A task generated an exception: {exc}",
-                            exc_info=args.verbose,
+                done, _ = concurrent.futures.wait(
+                    pending_searches | pending_follows,
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    if future in pending_searches:
+                        pending_searches.remove(future)
+                        searches_completed += 1
+                        try:
+                            term, identifiers, already_followed = future.result()
+                        except Exception as exc:
+                            # Log exceptions raised by the worker function itself
+                            logger.error(
+                                "A search task generated an exception: %s",
+                                exc,
+                                exc_info=args.verbose,
+                            )
+                            continue
+                        total_profiles_found += len(identifiers) + len(already_followed)
+                        logger.debug(
+                            "Search for '%s' completed. To follow: %d, Already followed: %d",
+                            term,
+                            len(identifiers),
+                            len(already_followed),
                         )
+                        # A profile followed earlier in this run is already in
+                        # FOLLOWED_PROFILES, so check both lists against this run's
+                        # set before crediting anything
+                        for identifier in already_followed:
+                            if identifier in queued_identifiers:
+                                skipped_duplicate_profiles += 1
+                                continue
+                            queued_identifiers.add(identifier)
+                            total_successful_follows += 1
+                        for identifier in identifiers:
+                            if identifier in queued_identifiers:
+                                skipped_duplicate_profiles += 1
+                                continue
+                            queued_identifiers.add(identifier)
+                            pending_follows.add(
+                                follow_executor.submit(process_follow, identifier, term)
+                            )
 
-                logging.info(
-                    f"{COLOR_SEPARATOR}--- Finished Batch {batch_num + 1}/{num_batches}. Processed {completed_in_batch} tasks. ---{COLOR_RESET}"
-                )
-                # Optional: Add a sleep between batches if rate limits are persistent across batches
-                # BATCH_SLEEP = 10 # seconds
-                # if batch_num < num_batches - 1: # Don't sleep after the last batch
-                #    logging.info(f"Sleeping for {BATCH_SLEEP}s before starting next batch...")
-                #    time.sleep(BATCH_SLEEP)
+                    else:
+                        pending_follows.remove(future)
+                        follows_completed += 1
+                        try:
+                            if future.result():
+                                total_successful_follows += 1
+                        except Exception as exc:
+                            logger.error(
+                                "A follow task generated an exception: %s",
+                                exc,
+                                exc_info=args.verbose,
+                            )
+
+                # Periodic progress report, replacing the old per-batch headers
+                if searches_completed >= next_progress_report:
+                    logger.info(
+                        f"{COLOR_SEPARATOR}--- Progress: {searches_completed}/{unique_names_count} names searched, {follows_completed} follows completed, {len(pending_follows)} follows pending. ---{COLOR_RESET}"
+                    )
+                    next_progress_report = searches_completed + PROGRESS_REPORT_INTERVAL
 
-            logging.info("All batches have been processed.")
+            logger.info(
+                f"All names have been processed ({searches_completed} searches, {follows_completed} follows)."
+            )
 
     except FileNotFoundError:
-        logging.critical(f"Error: The names file '{NAMES_FILE}' was not found.")
+        logger.critical(f"Error: The names file '{NAMES_FILE}' was not found.")
         sys.exit(1)
     except KeyboardInterrupt:
-        logging.warning("Script interrupted by user (Ctrl+C).")
+        logger.warning("Script interrupted by user (Ctrl+C).")
         # Consider adding cleanup or partial results summary here if needed
         sys.exit(1)
     except Exception as e:
-        logging.critical(
+        logger.critical(
             f"An unexpected error occurred during script execution: {e}", exc_info=True
         )
         sys.exit(1)
+    finally:
+        if FOLLOWED_PROFILES is not None:
+            FOLLOWED_PROFILES.close()
 
     # --- Final Summary ---
     print(f"{COLOR_SEPARATOR}========================================{COLOR_RESET}")
-    logging.info("All tasks completed.")
-    logging.info(f"Total Names Read from '{NAMES_FILE}': {names_read_count}")
-    logging.info(
-        f"Total Unique Cleaned Names Submitted (across all batches): {total_tasks_submitted}"
+    logger.info("All tasks completed.")
+    logger.info(f"Total Names Read from '{NAMES_FILE}': {names_read_count}")
+    logger.info(
+        f"Total Unique Cleaned Names Submitted: {total_tasks_submitted}"
+    )
+    logger.info(f"Skipped Duplicate Cleaned Names: {skipped_duplicates}")
+    logger.info(f"Skipped Invalid/Empty Names: {skipped_invalid}")
+    logger.info(f"Total Profiles Found Across Searches: {total_profiles_found}")
+    logger.info(
+        f"Skipped Duplicate Profiles (found by more than one search): {skipped_duplicate_profiles}"
     )
-    logging.info(f"Skipped Duplicate Cleaned Names: {skipped_duplicates}")
-    logging.info(f"Skipped Invalid/Empty Names: {skipped_invalid}")
-    logging.info(f"Total Profiles Found Across Searches: {total_profiles_found}")
-    logging.info(
+    logger.info(
         f"Total Successful Follows (or Already Following): {total_successful_follows}"
     )
-    logging.info("Script finished.")
+    logger.info("Script finished.")
     print(f"{COLOR_SEPARATOR}========================================{COLOR_RESET}")